@@ -171,7 +171,7 @@ def fullList(l, count):
         return
     d = count - n
     if d > 0:
-        l.extend([l[-1] for a in range(d)])
+        l.extend([l[-1]] * d)
     return
 
 def fullList_np(l, count):
@@ -183,7 +183,7 @@ def fullList_np(l, count):
     d = count - n
     if d > 0:
         try:
-            l.extend([l[-1] for a in range(d)])
+            l.extend([l[-1]] * d)
         except:
             l = numpy_full_list(l, n)
     else:
@@ -740,7 +740,8 @@ def Vector_generate(prop):
 
 def Vector_degenerate(prop):
     """return a simple list of values instead of Vector() objects"""
-    return [[v[0:3] for v in obj] for obj in prop]
+    return [obj.tolist() if isinstance(obj, ndarray) else [v[0:3] for v in obj]
+                for obj in prop]
 
 
 def Edg_pol_generate(prop):
@@ -128,6 +128,17 @@ except ImportError:
     info(ladydug_d.message)
     ladybug = None
 
+numba_d = sv_dependencies["numba"] = SvDependency("numba", "https://numba.pydata.org/")
+numba_d.pip_installable = True
+try:
+    import numba
+    numba_d.message = "Numba package is available"
+    numba_d.module = numba
+except ImportError:
+    numba_d.message = "Numba package is not available. Some nodes will use slower pure-python fallbacks"
+    info(numba_d.message)
+    numba = None
+
 freecad_d = sv_dependencies["freecad"] = SvDependency("FreeCAD", "https://www.freecadweb.org/")
 try:
     import FreeCAD
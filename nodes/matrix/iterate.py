@@ -30,11 +30,6 @@ from sverchok.data_structure import updateNode, match_long_repeat, Matrix_genera
 def concat(lists):
     return reduce(iadd, lists)
 
-# no longer used. scedule to delete
-def Matrix_degenerate(ms):
-    return [[j[:] for j in M] for M in ms]
-
-
 def iterate_matrices(matrices, vertices, edges, faces, count, offset, r=0):
     result_vertices = []
     result_edges = []
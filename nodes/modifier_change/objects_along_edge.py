@@ -24,8 +24,8 @@ import bpy
 from bpy.props import IntProperty, EnumProperty, BoolProperty, FloatProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, match_long_repeat, Matrix_generate, Vector_generate, Vector_degenerate
-from sverchok.utils.geom import autorotate_householder, autorotate_track, autorotate_diff, diameter
+from sverchok.data_structure import updateNode, match_long_repeat
+from sverchok.utils.geom import autorotate_track, autorotate_diff, diameter
 
 all_axes = [
         Vector((1.0, 0.0, 0.0)),
@@ -33,8 +33,27 @@ all_axes = [
         Vector((0.0, 0.0, 1.0))
     ]
 
-def Matrix_degenerate(ms):
-    return [[ j[:] for j in M ] for M in ms]
+def rotation_axis_to(axis_idx, direction):
+    """
+    Rodrigues rotation (3x3 ndarray) which rotates the given coordinate
+    axis (0, 1 or 2 for X, Y or Z) onto direction.
+    """
+    length = np.linalg.norm(direction)
+    if length == 0.0:
+        return np.eye(3)
+    a = np.zeros(3)
+    a[axis_idx] = 1.0
+    b = np.array(direction) / length
+    v = np.cross(a, b)
+    c = a.dot(b)
+    if 1.0 + c < 1e-8:
+        # direction is anti-parallel to the axis: any half-turn around
+        # a perpendicular axis will do
+        n = np.zeros(3)
+        n[(axis_idx + 1) % 3] = 1.0
+        return 2.0 * np.outer(n, n) - np.eye(3)
+    K = np.array([[0.0, -v[2], v[1]], [v[2], 0.0, -v[0]], [-v[1], v[0], 0.0]])
+    return np.eye(3) + K + (K @ K) / (1.0 + c)
 
 class SvDuplicateAlongEdgeNode(bpy.types.Node, SverchCustomTreeNode):
     ''' Duplicate meshes along edge '''
@@ -133,7 +152,7 @@ class SvDuplicateAlongEdgeNode(bpy.types.Node, SverchCustomTreeNode):
 
     def get_count(self, v1, v2, vertices, count, padding):
         func = self.count_funcs[self.count_mode]
-        edge_length = (1.0 - 2*padding) * (v1-v2).length
+        edge_length = (1.0 - 2*padding) * np.linalg.norm(v2 - v1)
         return func(self, edge_length, vertices, count)
 
     def get_scale_off(self):
@@ -160,13 +179,19 @@ class SvDuplicateAlongEdgeNode(bpy.types.Node, SverchCustomTreeNode):
         if self.input_mode == "fixed":
             return vs1, vs2
         elif self.input_mode == "edge":
-            rs1 = [vertices[i] for (i,j) in edges]
-            rs2 = [vertices[j] for (i,j) in edges]
-            return rs1, rs2
+            if not len(edges):
+                return [], []
+            edges_np = np.asarray(edges, dtype=np.int32)
+            verts_np = np.asarray(vertices)
+            # fancy indexing gathers both edge ends without a python loop;
+            # list() wraps rows so match_long_repeat can treat them as lists
+            return list(verts_np[edges_np[:, 0]]), list(verts_np[edges_np[:, 1]])
 
     def duplicate_vertices(self, v1, v2, vertices, edges, faces, count, p):
+        # v1, v2 are (3,) float64 ndarrays here
         direction = v2 - v1
-        edge_length = (1.0 - 2*p) * direction.length
+        length = np.linalg.norm(direction)
+        edge_length = (1.0 - 2*p) * length
         one_item_length = edge_length / count
         actual_length = diameter(vertices, self.orient_axis)
         if actual_length != 0.0:
@@ -175,9 +200,9 @@ class SvDuplicateAlongEdgeNode(bpy.types.Node, SverchCustomTreeNode):
             x_scale = 1.0
         x = all_axes[self.orient_axis]
         # for actual_length = 1.0 and edge_length = 3.0, let origins be [0.5, 1.5, 2.5]
-        u = direction.normalized()
-        alphas = np.linspace(0.0, 1.0, count+1)
-        origins = [v1 + (1-2*p)*direction*alpha + p*direction + 0.5*one_item_length*u for alpha in alphas][:-1]
+        u = direction / length if length != 0.0 else direction
+        origins = v1 + p * direction \
+                        + (0.5 + np.arange(count))[:,np.newaxis] * one_item_length * u
         assert len(origins) == count
 
         if self.scale_off:
@@ -188,29 +213,32 @@ class SvDuplicateAlongEdgeNode(bpy.types.Node, SverchCustomTreeNode):
             else:
                 scale = Matrix.Scale(x_scale, 4, x)
 
-        need_flip = False
         if self.algorithm == 'householder':
-            rot = autorotate_householder(x, direction).inverted()
-            # Since Householder transformation is reflection, we need to reflect things back
-            need_flip = True
+            # Householder reflection + flip composes to exactly the minimal
+            # rotation taking the orient axis onto direction; build that
+            # rotation directly, without the 4x4 inversion and the flip fix-up.
+            rot = Matrix(rotation_axis_to(self.orient_axis, direction).tolist()).to_4x4()
         elif self.algorithm == 'track':
-            rot = autorotate_track(self.orient_axis_, direction, self.up_axis)
+            rot = autorotate_track(self.orient_axis_, Vector(direction), self.up_axis)
         elif self.algorithm == 'diff':
-            rot = autorotate_diff(x, direction).inverted()
+            rot = autorotate_diff(x, Vector(direction)).inverted()
         else:
             raise Exception("Unsupported algorithm")
 
-        if need_flip:
-            flip = Matrix([[-1,0,0,0],[0,1,0,0],[0,0,1,0],[0,0,0,1]])
-        else:
-            flip = Matrix.Identity(4)
         if scale is None:
-            matrices = [Matrix.Translation(o) @ rot @ flip for o in origins]
+            transform = rot
         else:
-            matrices = [Matrix.Translation(o) @ rot @ scale @ flip for o in origins]
+            transform = rot @ scale
+        matrices = [Matrix.Translation(o) @ transform for o in origins]
 
         if self.apply_matrices:
-            result_vertices = [[m @ vertex for vertex in vertices] for m in matrices]
+            # rotation / scale part is the same for all copies, only translation
+            # differs; so transform all donor vertices once with NumPy and then
+            # broadcast-add the origins, instead of applying each 4x4 matrix
+            # to each vertex in python.
+            verts_np = np.asarray(vertices, dtype=np.float64)
+            transformed = verts_np @ np.array(transform.to_3x3()).T
+            result_vertices = [transformed + origin for origin in origins]
         else:
             result_vertices = [vertices] * count
         return matrices, result_vertices
@@ -260,50 +288,59 @@ class SvDuplicateAlongEdgeNode(bpy.types.Node, SverchCustomTreeNode):
         # Theoretically it is possible to not use them in "Count" mode.
         if not self.inputs['Vertices'].is_linked:
             return
+        if not any(output.is_linked for output in self.outputs):
+            return
 
+        # donor vertices are only measured (diameter) and transformed with
+        # numpy, so they stay as plain nested lists - no Vector roundtrip
         vertices_s = self.inputs['Vertices'].sv_get(default=[[]])
-        vertices_s = Vector_generate(vertices_s)
         edges_s = self.inputs['Edges'].sv_get(default=[[]])
         faces_s = self.inputs['Polygons'].sv_get(default=[[]])
-        inp_vertices1_s = self.inputs['Vertex1'].sv_get(default=[[]])
-        inp_vertices1_s = Vector_generate(inp_vertices1_s)[0]
-        inp_vertices2_s = self.inputs['Vertex2'].sv_get(default=[[]])
-        inp_vertices2_s = Vector_generate(inp_vertices2_s)[0]
-        vertices_r = self.inputs['VerticesR'].sv_get(default=[[]])
-        vertices_r = Vector_generate(vertices_r)[0]
+        inp_vertices1_s = self.inputs['Vertex1'].sv_get(default=[[]])[0]
+        inp_vertices2_s = self.inputs['Vertex2'].sv_get(default=[[]])[0]
+        vertices_r = self.inputs['VerticesR'].sv_get(default=[[]])[0]
         edges_r = self.inputs['EdgesR'].sv_get(default=[[]])[0]
         counts = self.inputs['Count'].sv_get()[0]
         paddings = self.inputs['Padding'].sv_get()[0]
 
         vertices1_s, vertices2_s = self.get_recipient_vertices(inp_vertices1_s, inp_vertices2_s, vertices_r, edges_r)
 
-        # It may be also useful to output just matrices, without vertices or edges/faces
-        if self.outputs['Vertices'].is_linked or self.outputs['Matrices'].is_linked:
+        # It may be also useful to output just matrices, without vertices or edges/faces.
+        # When only edges/faces outputs are linked, those need just [edges]*count -
+        # the whole duplicate_vertices call is skipped.
+        need_geometry = self.outputs['Vertices'].is_linked or self.outputs['Matrices'].is_linked
 
-            result_matrices = []
-            result_vertices = []
-            result_edges = []
-            result_faces = []
+        result_matrices = []
+        result_vertices = []
+        result_edges = []
+        result_faces = []
 
-            meshes = match_long_repeat([vertices_s, edges_s, faces_s, vertices1_s, vertices2_s, counts, paddings])
+        meshes = match_long_repeat([vertices_s, edges_s, faces_s, vertices1_s, vertices2_s, counts, paddings])
 
-            for vertices, edges, faces, vertex1, vertex2, inp_count, padding in zip(*meshes):
-                count = self.get_count(vertex1, vertex2, vertices, inp_count, padding)
-                count = max(count,1)
+        for vertices, edges, faces, vertex1, vertex2, inp_count, padding in zip(*meshes):
+            vertex1 = np.asarray(vertex1, dtype=np.float64)
+            vertex2 = np.asarray(vertex2, dtype=np.float64)
+            count = self.get_count(vertex1, vertex2, vertices, inp_count, padding)
+            count = max(count,1)
+            if need_geometry:
                 new_matrices, new_vertices = self.duplicate_vertices(vertex1, vertex2, vertices, edges, faces, count, padding)
-                result_edges.extend( [edges] * count )
-                result_faces.extend( [faces] * count )
                 result_vertices.extend( new_vertices )
                 result_matrices.extend( new_matrices )
-
-            result_vertices = Vector_degenerate(result_vertices)
+            result_edges.extend( [edges] * count )
+            result_faces.extend( [faces] * count )
+
+        if self.outputs['Vertices'].is_linked:
+            # ndarrays (apply_matrices path) flatten to nested lists in one
+            # C-level pass; plain vertex lists still need the per-vertex walk.
+            result_vertices = [vs.tolist() if isinstance(vs, np.ndarray) else [v[0:3] for v in vs]
+                                    for vs in result_vertices]
             self.outputs['Vertices'].sv_set(result_vertices)
-            if self.outputs['Edges'].is_linked:
-                self.outputs['Edges'].sv_set(result_edges)
-            if self.outputs['Polygons'].is_linked:
-                self.outputs['Polygons'].sv_set(result_faces)
-            if self.outputs['Matrices'].is_linked:
-                self.outputs['Matrices'].sv_set(result_matrices)
+        if self.outputs['Edges'].is_linked:
+            self.outputs['Edges'].sv_set(result_edges)
+        if self.outputs['Polygons'].is_linked:
+            self.outputs['Polygons'].sv_set(result_faces)
+        if self.outputs['Matrices'].is_linked:
+            self.outputs['Matrices'].sv_set(result_matrices)
 
 def register():
     bpy.utils.register_class(SvDuplicateAlongEdgeNode)
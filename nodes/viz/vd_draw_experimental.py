@@ -5,11 +5,13 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+from itertools import chain
 from math import pi
 
 import bgl
 import bpy
 import gpu
+import numpy as np
 from gpu_extras.batch import batch_for_shader
 
 from bpy.props import (
@@ -19,14 +21,14 @@ from mathutils import Vector, Matrix
 from mathutils.geometry import tessellate_polygon as tessellate
 from numpy import ndarray
 
+from sverchok.dependencies import numba
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import node_id, updateNode, enum_item_5, match_long_repeat
 from sverchok.ui.bgl_callback_3dview import callback_disable, callback_enable
 from sverchok.utils.sv_shader_sources import dashed_vertex_shader, dashed_fragment_shader
-from sverchok.utils.sv_batch_primitives import MatrixDraw28
+from sverchok.utils.sv_batch_primitives import MatrixDrawBatch28
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.geom import multiply_vectors_deep
-from sverchok.utils.modules.geom_utils import obtain_normal3 as normal
 from sverchok.utils.context_managers import hard_freeze
 from sverchok.utils.sv_mesh_utils import mesh_join
 
@@ -58,19 +60,106 @@ default_fragment_shader = '''
 
 def edges_from_faces(indices):
     """ we don't want repeat edges, ever.."""
-    out = set()
-    concat = out.add
-    for face in indices:
-        for edge in zip(face, list(face[1:]) + list([face[0]])):
-            concat(tuple(sorted(edge)))
-    return list(out)
+    if not len(indices):
+        return []
 
+    # csr layout of the faces: flat vertex indices + per-face offsets
+    lengths = np.fromiter(map(len, indices), dtype=np.int32, count=len(indices))
+    flat = np.fromiter(chain.from_iterable(indices), dtype=np.int32, count=int(lengths.sum()))
+    offsets = np.zeros(lengths.size + 1, dtype=np.int32)
+    np.cumsum(lengths, out=offsets[1:])
 
-def ensure_triangles(coords, indices, handle_concave_quads):
+    # pair each vertex with the next one in its face, wrapping at face ends
+    other = np.roll(flat, -1)
+    other[offsets[1:] - 1] = flat[offsets[:-1]]
+
+    # canonicalize branchlessly and pack each pair into one int64, so the
+    # dedup is a plain 1-D np.unique instead of the slower axis=0 variant
+    lo = np.minimum(flat, other).astype(np.int64)
+    hi = np.maximum(flat, other).astype(np.int64)
+    keys = np.unique((lo << 32) | hi)
+    return np.stack((keys >> 32, keys & 0xFFFFFFFF), axis=1).astype(np.int32)
+
+
+def apply_matrix_np(m, coords):
+    """
+    transform coords (any array-like of xyz triples) by mathutils matrix m,
+    with one GEMM instead of a python loop over Vectors
+    """
+    m_np = np.array(m)
+    return np.asarray(coords) @ m_np[:3, :3].T + m_np[:3, 3]
+
+
+_shader_cache = {}
+
+def get_builtin_shader(name):
+    """
+    cached gpu.shader.from_builtin - it is called per draw call per redraw
+    otherwise. lazy on purpose: the gpu module needs a GL context, which
+    does not exist yet at module import time.
+    """
+    shader = _shader_cache.get(name)
+    if shader is None:
+        shader = _shader_cache[name] = gpu.shader.from_builtin(name)
+    return shader
+
+
+def get_buffer(buffers, key, shape, dtype):
+    """
+    reuse a previously allocated ndarray while shape and dtype still match,
+    so steady-state redraws don't touch the allocator
+    """
+    buf = buffers.get(key)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = buffers[key] = np.empty(shape, dtype)
+    return buf
+
+
+def fan_triangulate(flat, offsets, out):
+    """
+    fan-split faces given in csr layout (flat indices + per-face offsets)
+    into the preallocated (num_tris, 3) out array. only correct for tris
+    and convex quads - ngons must go through the real tessellator.
+    """
+    n = 0
+    for i in range(offsets.shape[0] - 1):
+        start, stop = offsets[i], offsets[i + 1]
+        a = flat[start]
+        for j in range(start + 1, stop - 1):
+            out[n, 0] = a
+            out[n, 1] = flat[j]
+            out[n, 2] = flat[j + 1]
+            n += 1
+
+if numba is not None:
+    fan_triangulate = numba.njit(cache=True)(fan_triangulate)
+
+
+def ensure_triangles(coords, indices, handle_concave_quads, buffers=None):
     """
     this fully tesselates the incoming topology into tris,
     not optimized for meshes that don't contain ngons
     """
+    lengths = np.fromiter(map(len, indices), dtype=np.int32, count=len(indices))
+    max_fan_verts = 3 if handle_concave_quads else 4
+    if lengths.size and lengths.min() >= 3 and lengths.max() <= max_fan_verts:
+        flat = np.fromiter(chain.from_iterable(indices), dtype=np.int32, count=int(lengths.sum()))
+        if lengths.max() == 3:
+            # pure-tris input (common with triangulating nodes upstream):
+            # the flat indices are already the answer
+            return flat.reshape(-1, 3)
+
+        # hot path: tris / convex quads only, fan-split over contiguous buffers
+        offsets = np.zeros(lengths.size + 1, dtype=np.int32)
+        np.cumsum(lengths, out=offsets[1:])
+        num_tris = int((lengths - 2).sum())
+        if buffers is None:
+            out = np.empty((num_tris, 3), dtype=np.int32)
+        else:
+            out = get_buffer(buffers, 'tri_indices', (num_tris, 3), np.int32)
+        fan_triangulate(flat, offsets, out)
+        return out
+
     new_indices = []
     concat = new_indices.append
     concat2 = new_indices.extend
@@ -88,50 +177,76 @@ def ensure_triangles(coords, indices, handle_concave_quads):
     return new_indices
 
 
-def generate_facet_data(verts, faces, face_color, vector_light):
-    out_verts = []
-    out_vcols = []
-    concat_verts = out_verts.extend
-    concat_vcols = out_vcols.extend
-    for face in faces:
-        vecs = [verts[j] for j in face]
-        concat_verts(vecs)
+def generate_facet_data(verts, faces, face_color, vector_light, buffers=None):
+    """
+    faces are expected to be tris already (ensure_triangles ran first),
+    vector_light to be normalized (fill_config does that once per process)
+    """
+    if len(faces) == 0:
+        return [], []
+    if buffers is None:
+        buffers = {}
 
-        normal_no = Vector(normal(*vecs))
-        normal_no = (normal_no.angle(vector_light, 0)) / pi
+    verts_np = np.asarray(verts, dtype=np.float32)
+    faces_np = np.asarray(faces, dtype=np.int32)
+    tri = verts_np[faces_np]                                       # (F, 3, 3)
 
-        r = (normal_no * face_color[0]) - 0.1
-        g = (normal_no * face_color[1]) - 0.1
-        b = (normal_no * face_color[2]) - 0.1
-        vcol = (r+0.2, g+0.2, b+0.2, 1.0)
-        concat_vcols([vcol, vcol, vcol])
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    light = np.asarray(vector_light, dtype=np.float64)
 
-    return out_verts, out_vcols
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_angle = (normals @ light) / lengths
+    angles = np.arccos(np.clip(cos_angle, -1.0, 1.0)) / pi
+    angles[lengths == 0.0] = 0.0    # same fallback as Vector.angle(light, 0)
 
+    # float32 is what the GPU consumes; emitting it directly halves the
+    # upload and skips a float64 -> float32 conversion pass in blender
+    vcols = get_buffer(buffers, 'facet_vcols', (faces_np.shape[0], 4), np.float32)
+    vcols[:, :3] = angles[:, np.newaxis] * np.asarray(face_color[:3]) + 0.1
+    vcols[:, 3] = 1.0
+
+    # one vertex and one color per triangle corner
+    corner_vcols = get_buffer(buffers, 'facet_corner_vcols', (faces_np.shape[0] * 3, 4), np.float32)
+    corner_vcols.reshape(-1, 3, 4)[:] = vcols[:, np.newaxis, :]
+    return tri.reshape(-1, 3), corner_vcols
 
-def generate_smooth_data(verts, faces, face_color, vector_light):
-    """ this piggy backs off bmesh's automated normal calculation... """
-    out_vcols = []
-    concat_vcols = out_vcols.append
 
+def smooth_vertex_normals(verts, faces):
+    """ this piggy backs off bmesh's automated normal calculation... """
     bm = bmesh_from_pydata(verts, [], faces, normal_update=True)
+    normals = np.array([vert.normal[:] for vert in bm.verts])
+    bm.free()
+    return normals
+
+
+def generate_smooth_data(verts, faces, face_color, vector_light, vert_normals=None):
+    """
+    vert colors from (cached or freshly computed) bmesh vertex normals;
+    vector_light is expected to be normalized
+    """
+    if vert_normals is None:
+        vert_normals = smooth_vertex_normals(verts, faces)
+    if not len(vert_normals):
+        return []
+
+    lengths = np.linalg.norm(vert_normals, axis=1)
+    light = np.asarray(vector_light, dtype=np.float64)
 
-    for vert in bm.verts:
-        normal_no = (vert.normal.angle(vector_light, 0)) / pi
-        r = (normal_no * face_color[0]) - 0.1
-        g = (normal_no * face_color[1]) - 0.1
-        b = (normal_no * face_color[2]) - 0.1
-        vcol = (r+0.2, g+0.2, b+0.2, 1.0)
-        concat_vcols(vcol)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_angle = (vert_normals @ light) / lengths
+    angles = np.arccos(np.clip(cos_angle, -1.0, 1.0)) / pi
+    angles[lengths == 0.0] = 0.0    # same fallback as Vector.angle(light, 0)
 
-    return out_vcols
+    vcols = np.empty((vert_normals.shape[0], 4), dtype=np.float32)
+    vcols[:, :3] = angles[:, np.newaxis] * np.asarray(face_color[:3]) + 0.1
+    vcols[:, 3] = 1.0
+    return vcols
 
 
 def draw_matrix(context, args):
     """ this takes one or more matrices packed into an iterable """
-    mdraw = MatrixDraw28()
-    for matrix in args[0]:
-        mdraw.draw_matrix(matrix)
+    MatrixDrawBatch28().draw_matrices(args[0])
 
 
 def draw_uniform(GL_KIND, coords, indices, color, width=1, dashed_data=None):
@@ -140,7 +255,7 @@ def draw_uniform(GL_KIND, coords, indices, color, width=1, dashed_data=None):
     elif GL_KIND == 'POINTS':
         bgl.glPointSize(width)
 
-    params = dict(indices=indices) if indices else {}
+    params = dict(indices=indices) if indices is not None and len(indices) > 0 else {}
 
     if GL_KIND == 'LINES' and dashed_data:
 
@@ -156,7 +271,7 @@ def draw_uniform(GL_KIND, coords, indices, color, width=1, dashed_data=None):
 
     else:
 
-        shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+        shader = get_builtin_shader('3D_UNIFORM_COLOR')
         batch = batch_for_shader(shader, GL_KIND, {"pos" : coords}, **params)
         shader.bind()
         shader.uniform_float("color", color)
@@ -170,8 +285,8 @@ def draw_uniform(GL_KIND, coords, indices, color, width=1, dashed_data=None):
 
 
 def draw_smooth(coords, vcols, indices=None):
-    shader = gpu.shader.from_builtin('3D_SMOOTH_COLOR')
-    params = dict(indices=indices) if indices else {}
+    shader = get_builtin_shader('3D_SMOOTH_COLOR')
+    params = dict(indices=indices) if indices is not None and len(indices) > 0 else {}
     batch = batch_for_shader(shader, 'TRIS', {"pos" : coords, "color": vcols}, **params)
     batch.draw(shader)
 
@@ -450,7 +565,8 @@ class SvVDExperimental(bpy.types.Node, SverchCustomTreeNode):
     def fill_config(self):
 
         config = lambda: None
-        config.vector_light = self.vector_light[:]
+        # normalized once here, so the shading kernels can use plain dot products
+        config.vector_light = Vector(self.vector_light).normalized()[:]
         config.vcol = self.vert_color[:]
         config.line4f = self.edge_color[:]
         config.face4f = self.face_color[:]
@@ -489,7 +605,9 @@ class SvVDExperimental(bpy.types.Node, SverchCustomTreeNode):
         if matrix_socket.is_linked:
             m = matrix_socket.sv_get(deepcopy=False, default=[Matrix()])
             verts, matrix = match_long_repeat([propv, m])
-            coords = [multiply_vectors_deep(mx, v) for mx, v in zip(matrix, verts)]
+            # numpy wins for dense meshes; below that its setup overhead loses
+            coords = [apply_matrix_np(mx, v) if len(v) > 128 else multiply_vectors_deep(mx, v)
+                            for mx, v in zip(matrix, verts)]
         else:
             matrix = [Matrix()]
             verts = coords
@@ -498,11 +616,24 @@ class SvVDExperimental(bpy.types.Node, SverchCustomTreeNode):
     def faces_diplay(self, geom, config):
 
         if self.selected_draw_mode == 'facet' and self.display_faces:
-            facet_verts, facet_verts_vcols = generate_facet_data(geom.verts, geom.faces, config.face4f, config.vector_light)
+            facet_verts, facet_verts_vcols = generate_facet_data(
+                geom.verts, geom.faces, config.face4f, config.vector_light, buffers=self.get_buffers())
             geom.facet_verts = facet_verts
             geom.facet_verts_vcols = facet_verts_vcols
         elif self.selected_draw_mode == 'smooth' and self.display_faces:
-            geom.smooth_vcols = generate_smooth_data(geom.verts, geom.faces, config.face4f, config.vector_light)
+            # rebuilding a bmesh every redraw just to read the vertex normals
+            # is expensive; reuse them while verts/faces are the same objects.
+            # the cached verts/faces references also pin the ids.
+            ND = self.node_dict.setdefault(hash(self), {})
+            cached = ND.get('smooth_normals')
+            if (cached is None or cached[0] is not geom.verts or cached[1] is not geom.face_indices
+                    or cached[2] != self.handle_concave_quads):
+                normals = smooth_vertex_normals(geom.verts, geom.faces)
+                ND['smooth_normals'] = (geom.verts, geom.face_indices, self.handle_concave_quads, normals)
+            else:
+                normals = cached[3]
+            geom.smooth_vcols = generate_smooth_data(
+                geom.verts, geom.faces, config.face4f, config.vector_light, vert_normals=normals)
         elif self.selected_draw_mode == 'fragment' and self.display_faces:
 
             config.draw_fragment_function = None
@@ -522,6 +653,10 @@ class SvVDExperimental(bpy.types.Node, SverchCustomTreeNode):
 
             config.batch = batch_for_shader(config.shader, 'TRIS', {"position": geom.verts}, indices=geom.faces)
 
+    def get_buffers(self):
+        """per-node scratch ndarrays, reused across redraws by get_buffer"""
+        return self.node_dict.setdefault(hash(self), {}).setdefault('buffers', {})
+
     def handle_attr_socket(self):
         """
         this socket expects input dictionary wrapped. once.
@@ -575,7 +710,10 @@ class SvVDExperimental(bpy.types.Node, SverchCustomTreeNode):
             if len(data[0]) > 1:
                 coords, edge_indices, face_indices = mesh_join(data[0], data[1], data[2])
             else:
-                coords, edge_indices, face_indices = [d[0].tolist() if type(d[0]) == ndarray else d[0] for d in data[:3]]
+                # coords may be an ndarray (matrix path / numpy-outputting
+                # origin node); batch_for_shader consumes it directly
+                coords = data[0][0]
+                edge_indices, face_indices = [d[0].tolist() if type(d[0]) == ndarray else d[0] for d in data[1:3]]
 
             geom = lambda: None
             geom.verts = coords
@@ -598,15 +736,25 @@ class SvVDExperimental(bpy.types.Node, SverchCustomTreeNode):
 
                 #  expecting mixed bag of tris/quads/ngons
                 if self.display_faces:
-                    geom.faces = ensure_triangles(coords, face_indices, self.handle_concave_quads)
+                    geom.faces = ensure_triangles(coords, face_indices, self.handle_concave_quads, self.get_buffers())
+                    # untriangulated faces; stable across redraws, so usable as a cache key
+                    geom.face_indices = face_indices
 
                 if self.display_edges:
                     if self.use_dashed:
                         self.add_gl_stuff_to_config(config)
 
                     # we don't want to draw the inner edges of triangulated faces; use original face_indices.
-                    # pass edges from socket if we can, else we manually compute them from faces
-                    geom.edges = edge_indices if edges_socket.is_linked else edges_from_faces(face_indices)
+                    # pass edges from socket if we can, else we manually compute them from faces -
+                    # cached by face-list identity, since redraws mostly see the same object
+                    if edges_socket.is_linked:
+                        geom.edges = edge_indices
+                    else:
+                        ND = self.node_dict.setdefault(hash(self), {})
+                        cached = ND.get('derived_edges')
+                        if cached is None or cached[0] is not face_indices:
+                            cached = ND['derived_edges'] = (face_indices, edges_from_faces(face_indices))
+                        geom.edges = cached[1]
 
                 if self.display_faces:
                     self.faces_diplay(geom, config)
@@ -19,10 +19,12 @@
 import itertools
 
 import bpy
+import numpy as np
 from bpy.props import (BoolProperty, StringProperty, FloatProperty, IntProperty)
 
 from mathutils import Vector
 
+from sverchok.dependencies import numba
 from sverchok.utils.sv_obj_helper import SvObjHelper
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 # from sverchok.utils.sv_viewer_utils import matrix_sanitizer
@@ -39,10 +41,170 @@ fill_modes_3d = tuple_to_enumdata('HALF', 'FRONT', 'BACK', 'FULL')
 mode_options = tuple_to_enumdata("Merge", "Duplicate", "Unique")
 
 def set_curve_props(node, cu):
-    cu.bevel_depth = node.depth
-    cu.bevel_resolution = node.resolution
-    cu.dimensions = node.curve_dimensions
-    cu.fill_mode = node.set_fill_mode()
+    # property writes tag the depsgraph even when the value is identical,
+    # so compare first. dimensions must be written before fill_mode - the
+    # valid fill enums depend on it.
+    dimensions = node.curve_dimensions
+    fill_mode = getattr(node, 'fill_' + dimensions)
+    if cu.bevel_depth != node.depth:
+        cu.bevel_depth = node.depth
+    if cu.bevel_resolution != node.resolution:
+        cu.bevel_resolution = node.resolution
+    if cu.dimensions != dimensions:
+        cu.dimensions = dimensions
+    if cu.fill_mode != fill_mode:
+        cu.fill_mode = fill_mode
+
+
+def edge_chains_csr(edges, num_verts):
+    """
+    group edges into connected chains of vertex indices, so each chain can
+    become a single multi-point POLY spline instead of one 2-point spline
+    per edge. chains end at branching vertices (degree > 2); closed loops
+    come out with the first vertex repeated at the end.
+
+    edges: (E, 2) int32 ndarray. returns (chain_flat, chain_offsets) int32
+    arrays in csr layout. numeric-only on purpose, so numba can jit it.
+    """
+    num_edges = edges.shape[0]
+    degree = np.zeros(num_verts, np.int32)
+    for i in range(num_edges):
+        degree[edges[i, 0]] += 1
+        degree[edges[i, 1]] += 1
+
+    offsets = np.zeros(num_verts + 1, np.int32)
+    for v in range(num_verts):
+        offsets[v + 1] = offsets[v] + degree[v]
+
+    cursor = offsets[:num_verts].copy()
+    neigh_vertex = np.empty(2 * num_edges, np.int32)
+    neigh_edge = np.empty(2 * num_edges, np.int32)
+    for i in range(num_edges):
+        va, vb = edges[i, 0], edges[i, 1]
+        neigh_vertex[cursor[va]] = vb
+        neigh_edge[cursor[va]] = i
+        cursor[va] += 1
+        neigh_vertex[cursor[vb]] = va
+        neigh_edge[cursor[vb]] = i
+        cursor[vb] += 1
+
+    used = np.zeros(num_edges, np.bool_)
+    chain_flat = np.empty(2 * num_edges, np.int32)
+    chain_offsets = np.empty(num_edges + 1, np.int32)
+    chain_offsets[0] = 0
+    n_flat = 0
+    n_chains = 0
+
+    for pass_idx in range(2):
+        for i in range(num_edges):
+            if pass_idx == 0:
+                # open chains start at endpoints or branching vertices..
+                start, current = edges[i, 0], edges[i, 1]
+                if degree[start] == 2 and degree[current] != 2:
+                    start, current = current, start
+                if degree[start] == 2 or used[i]:
+                    continue
+            else:
+                # ..whatever is left are closed loops of degree-2 vertices
+                if used[i]:
+                    continue
+                start, current = edges[i, 0], edges[i, 1]
+
+            used[i] = True
+            chain_flat[n_flat] = start
+            chain_flat[n_flat + 1] = current
+            n_flat += 2
+            while degree[current] == 2:
+                advanced = False
+                for k in range(offsets[current], offsets[current + 1]):
+                    if not used[neigh_edge[k]]:
+                        used[neigh_edge[k]] = True
+                        current = neigh_vertex[k]
+                        chain_flat[n_flat] = current
+                        n_flat += 1
+                        advanced = True
+                        break
+                if not advanced:
+                    break
+            n_chains += 1
+            chain_offsets[n_chains] = n_flat
+
+    return chain_flat[:n_flat], chain_offsets[:n_chains + 1]
+
+if numba is not None:
+    edge_chains_csr = numba.njit(cache=True)(edge_chains_csr)
+
+
+def edges_to_chain_buffers(verts, edges):
+    """validated entry to edge_chains_csr - the jitted walk has no bounds
+    checks, so bad indices must be rejected before it runs"""
+    edges_np = np.asarray(edges, dtype=np.int32)
+    if edges_np.size and (edges_np.min() < 0 or edges_np.max() >= len(verts)):
+        raise IndexError(f"edge indices out of range for {len(verts)} vertices")
+    return edge_chains_csr(edges_np, len(verts))
+
+
+def verts_to_xyzw(verts):
+    """(N, 3) array-like -> contiguous float32 (N, 4) with w=0, the exact
+    layout foreach_set('co', ...) memcpys without per-element conversion"""
+    verts_xyzw = np.zeros((len(verts), 4), dtype=np.float32)
+    verts_xyzw[:, :3] = np.asarray(verts, dtype=np.float32)
+    return verts_xyzw
+
+
+def splines_layout_matches(cu, chain_offsets):
+    """True when the existing POLY splines already have the chain layout,
+    so their points can be overwritten in place"""
+    if len(cu.splines) != len(chain_offsets) - 1:
+        return False
+    for i, spline in enumerate(cu.splines):
+        if spline.type != 'POLY' or spline.use_cyclic_u:
+            return False
+        if len(spline.points) != chain_offsets[i + 1] - chain_offsets[i]:
+            return False
+    return True
+
+
+def write_poly_splines(cu, points_xyzw, chain_offsets, reuse=False):
+    """
+    one POLY spline per chain; points_xyzw is a (total, 4) float32 array with
+    w=0, laid out chain after chain per the offsets - so every spline reads a
+    contiguous slice, and the gather happens once at the caller.
+
+    with reuse=True the caller skipped the splines.clear(); when the spline
+    layout still matches (typical when only vertex positions move between
+    updates) the points are overwritten in place with no RNA allocations.
+    """
+    if reuse:
+        if splines_layout_matches(cu, chain_offsets):
+            for i, spline in enumerate(cu.splines):
+                coords = points_xyzw[chain_offsets[i]:chain_offsets[i + 1]]
+                spline.points.foreach_set('co', coords.ravel())
+            # foreach_set alone does not tag the datablock for depsgraph
+            cu.update_tag()
+            return
+        if cu.splines:
+            cu.splines.clear()
+
+    splines_new = cu.splines.new
+    for i in range(len(chain_offsets) - 1):
+        coords = points_xyzw[chain_offsets[i]:chain_offsets[i + 1]]
+        # each spline has a default first coordinate, add the rest
+        points = splines_new('POLY').points
+        points.add(len(coords) - 1)
+        points.foreach_set('co', coords.ravel())
+
+
+# generated object names per (tree, node) - lets get_children filter with a
+# set lookup instead of reading idprops off every object in bpy.data
+_generated_children = {}
+
+def register_children(node, names):
+    key = (node.id_data.name, node.name)
+    children = _generated_children.get(key)
+    if children is None:
+        children = _generated_children[key] = set()
+    children.update(names)
 
 
 # -- DUPLICATES --
@@ -62,107 +224,130 @@ def make_duplicates_live_curve(node, obj_index, verts, edges, matrices):
     if not cu:
         cu = curves.new(name=curve_name, type='CURVE')
 
-    # wipe!
-    if cu.splines:
-        cu.splines.clear()
-
     set_curve_props(node, cu)
 
-    # rebuild!
-    for edge in edges:
-        v0, v1 = verts[edge[0]], verts[edge[1]]
-        full_flat = [v0[0], v0[1], v0[2], 0.0, v1[0], v1[1], v1[2], 0.0]
-
-        # each spline has a default first coordinate but we need two.
-        segment = cu.splines.new('POLY')
-        segment.points.add(1)
-        segment.points.foreach_set('co', full_flat)
+    # rebuild, reusing the existing spline layout when it still matches
+    if len(edges):
+        chain_flat, chain_offsets = edges_to_chain_buffers(verts, edges)
+        write_poly_splines(cu, verts_to_xyzw(verts)[chain_flat], chain_offsets, reuse=True)
+    elif cu.splines:
+        cu.splines.clear()
 
     # if object reference exists, pick it up else make a new one
-    # assign the same curve to all Objects.
+    # assign the same curve datablock to all Objects.
+    base_name = node.basedata_name
+    node_name = node.name
+
+    # format every name once, and trade N objects.get calls (a list walk in
+    # bpy) for a single pass over bpy.data.objects
+    names = [f'{base_name}.{i:04d}' for i in range(len(matrices))]
+    register_children(node, names)
+    prefix = base_name + '.'
+    existing = {obj.name: obj for obj in objects if obj.name.startswith(prefix)}
+
     for obj_index, matrix in enumerate(matrices):
 
         # get object to clone the Curve data into.
-        obj_name = f'{node.basedata_name}.{obj_index:04d}'
-
-        obj = objects.get(obj_name)
+        obj_name = names[obj_index]
+        obj = existing.get(obj_name)
         if not obj:
             obj = objects.new(obj_name, cu)
             collection.objects.link(obj)
 
-        # make sure this object is known by its origin
-        obj['basedata_name'] = node.basedata_name
-        obj['madeby'] = node.name
-        obj['idx'] = obj_index
-        obj.matrix_local = matrix
+        # make sure this object is known by its origin; idprop writes tag
+        # updates, so only touch them when the value actually changed
+        if obj.get('basedata_name') != base_name:
+            obj['basedata_name'] = base_name
+        if obj.get('madeby') != node_name:
+            obj['madeby'] = node_name
+        if obj.get('idx') != obj_index:
+            obj['idx'] = obj_index
+        # assignment tags the depsgraph even when nothing moved; reading
+        # back and comparing does not
+        if obj.matrix_local != matrix:
+            obj.matrix_local = matrix
 
 
 # -- MERGE --
 def make_merged_live_curve(node, obj_index, verts, edges, matrices):
 
     obj, cu = node.get_obj_curve(obj_index)
+    register_children(node, [obj.name])
     set_curve_props(node, cu)
 
+    if not len(edges):
+        return
+
+    # transform all vertices per matrix with a single matmul each, instead
+    # of two Vector multiplies per edge per matrix. the matrices are affine,
+    # so the 3x3 linear block plus the translation column is enough - no
+    # homogeneous padding, and the w column stays 0 for the spline points.
+    chain_flat, chain_offsets = edges_to_chain_buffers(verts, edges)
+    # the gather is invariant per matrix: lay the vertices out in chain order
+    # once, transform that buffer, and let each spline read its slice
+    chain_verts = np.asarray(verts, dtype=np.float32)[chain_flat]
+    transformed = np.zeros((len(chain_verts), 4), dtype=np.float32)
+
     for m in matrices:
+        m_np = np.asarray(m, dtype=np.float32)
+        transformed[:, :3] = chain_verts @ m_np[:3, :3].T + m_np[:3, 3]
+        write_poly_splines(cu, transformed, chain_offsets)
 
-        # and rebuild
-        for edge in edges:
-            v0, v1 = m @ Vector(verts[edge[0]]), m @ Vector(verts[edge[1]])
 
-            full_flat = [v0[0], v0[1], v0[2], 0.0, v1[0], v1[1], v1[2], 0.0]
+# -- UNIQUE --
+def live_curve_3d(obj_index, verts, edges, matrix, node):
 
-            # each spline has a default first coordinate but we need two.
-            segment = cu.splines.new('POLY')
-            segment.points.add(1)
-            segment.points.foreach_set('co', full_flat)
+    obj, cu = node.get_obj_curve(obj_index, clear_splines=False)
+    register_children(node, [obj.name])
+    set_curve_props(node, cu)
 
+    # and rebuild, reusing the existing spline layout when it still matches
+    if len(edges):
+        chain_flat, chain_offsets = edges_to_chain_buffers(verts, edges)
+        write_poly_splines(cu, verts_to_xyzw(verts)[chain_flat], chain_offsets, reuse=True)
+    elif cu.splines:
+        cu.splines.clear()
+
+    return obj
 
-# -- UNIQUE --
-def live_curve(obj_index, verts, edges, matrix, node):
+
+def live_curve_2d(obj_index, verts, edges, matrix, node):
 
     obj, cu = node.get_obj_curve(obj_index)
+    register_children(node, [obj.name])
     set_curve_props(node, cu)
 
     # and rebuild
-
-    if node.curve_dimensions == '3D':
-
-        for edge in edges:
-            v0, v1 = verts[edge[0]], verts[edge[1]]
-            full_flat = [v0[0], v0[1], v0[2], 0.0, v1[0], v1[1], v1[2], 0.0]
-
-            # each spline has a default first coordinate but we need two.
-            segment = cu.splines.new('POLY')
-            segment.points.add(1)
-            segment.points.foreach_set('co', full_flat)
-    else:
-
-        for v_obj, e_obj in zip(verts, edges):
-            segment = cu.splines.new('POLY')
-            #v1, v2, v3 = v_obj[e_obj[0][0]]
-            #points = [v1, v2, v3, 0.0]
-            points = []
-            prev = []
-            if len(v_obj) == len(e_obj):
-                e_obj.pop(-1)
-            e_obj.sort()
-            segment.points.add(len(e_obj))
-            for edge in e_obj:
-                for e in edge:
-                    if e not in prev:
-                        prev.append(e)
-                        v1 = v_obj[e]
-                        points.extend([v1[0], v1[1], v1[2], 0.0])
-            segment.points.foreach_set('co', points)
-            segment.use_cyclic_u = True
+    splines_new = cu.splines.new
+    for v_obj, e_obj in zip(verts, edges):
+        segment = splines_new('POLY')
+        # non-mutating: the socket data must not lose edges between updates,
+        # so slice/argsort copies instead of pop/sort in place
+        edges_np = np.asarray(e_obj, dtype=np.int32).reshape(-1, 2)
+        if len(v_obj) == len(edges_np):
+            edges_np = edges_np[:-1]
+        edges_np = edges_np[np.lexsort((edges_np[:, 1], edges_np[:, 0]))]
+        segment.points.add(len(edges_np))
+
+        # ordered dedupe with O(1) membership instead of scanning a list
+        seen = set()
+        order = []
+        for edge in edges_np:
+            for e in edge:
+                if e not in seen:
+                    seen.add(e)
+                    order.append(e)
+
+        points = np.zeros((len(order), 4), dtype=np.float32)
+        points[:, :3] = np.asarray(v_obj, dtype=np.float32)[order]
+        segment.points.foreach_set('co', points.ravel())
+        segment.use_cyclic_u = True
 
     return obj
 
 
-def make_curve_geometry(node, context, obj_index, verts, *topology):
-    edges, matrix = topology
-
-    sv_object = live_curve(obj_index, verts, edges, matrix, node)
+def make_curve_geometry(node, context, obj_index, verts, edges, matrix, live_curve_fn):
+    sv_object = live_curve_fn(obj_index, verts, edges, matrix, node)
     sv_object.hide_select = False
     node.push_custom_matrix_if_present(sv_object, matrix)
 
@@ -236,8 +421,20 @@ class SvCurveViewerNodeV28(bpy.types.Node, SverchCustomTreeNode, SvObjHelper):
     def draw_label(self):
         return f"CV {self.basedata_name}"
 
-    def set_fill_mode(self):
-        return getattr(self, "fill_" + self.curve_dimensions)
+    def get_children(self):
+        # SvObjHelper's implementation reads type + an idprop off every object
+        # in bpy.data; the registry of generated names lets a set lookup
+        # exclude foreign objects before any RNA idprop access
+        key = (self.id_data.name, self.name)
+        names = _generated_children.get(key)
+        if names is None:
+            # cold start (fresh file or reload): fall back to the full scan
+            objs = super().get_children()
+            _generated_children[key] = {obj.name for obj in objs}
+            return objs
+        base = self.basedata_name
+        return [obj for obj in bpy.data.objects
+                    if obj.name in names and obj.get('basedata_name') == base]
 
     def remove_cloner_curve(self, obj_index):
         # opportunity to remove the .cloner.
@@ -275,17 +472,6 @@ class SvCurveViewerNodeV28(bpy.types.Node, SverchCustomTreeNode, SvObjHelper):
         mmtrix = get('matrix')
         return mverts, medges, mmtrix
 
-    def get_structure(self, stype, sindex):
-        if not stype:
-            return []
-
-        try:
-            j = stype[sindex]
-        except IndexError:
-            j = []
-        finally:
-            return j
-
     def process(self):
 
         if not self.activate:
@@ -300,6 +486,10 @@ class SvCurveViewerNodeV28(bpy.types.Node, SverchCustomTreeNode, SvObjHelper):
 
         mverts, *mrest = self.get_geometry_from_sockets()
 
+        # SoA: one float32 array per verts payload, converted once here -
+        # all downstream gathers and xyzw packing index it directly
+        mverts = [np.asarray(verts, dtype=np.float32) for verts in mverts]
+
         mode = self.selected_mode
         single_set = (len(mverts) == 1) and (len(mrest[-1]) > 1)
         has_matrices = self.inputs['matrix'].is_linked
@@ -315,10 +505,6 @@ class SvCurveViewerNodeV28(bpy.types.Node, SverchCustomTreeNode, SvObjHelper):
 
             else:
 
-                def get_edges_matrices(obj_index):
-                    for geom in mrest:
-                        yield self.get_structure(geom, obj_index)
-
                 # extend all non empty lists to longest of mverts or *mrest
                 maxlen = max(len(mverts), *(map(len, mrest)))
                 fullList(mverts, maxlen)
@@ -328,19 +514,25 @@ class SvCurveViewerNodeV28(bpy.types.Node, SverchCustomTreeNode, SvObjHelper):
 
                 if self.curve_dimensions == '3D':
 
+                    # direct indexing into the padded lists, instead of a
+                    # per-object generator doing try/except lookups
+                    edges_list = mrest[0] or [[]] * maxlen
+                    matrices_list = mrest[1] or [[]] * maxlen
+
                     for obj_index, Verts in enumerate(mverts):
                         if len(Verts) == 0:
                             continue
 
-                        data = get_edges_matrices(obj_index)
-                        make_curve_geometry(self, bpy.context, obj_index, Verts, *data)
+                        make_curve_geometry(self, bpy.context, obj_index, Verts,
+                                            edges_list[obj_index], matrices_list[obj_index],
+                                            live_curve_3d)
 
                     # we must be explicit
                     obj_index = len(mverts) - 1
 
                 else:
                     obj_index = 0
-                    make_curve_geometry(self, bpy.context, obj_index, mverts, *mrest)
+                    make_curve_geometry(self, bpy.context, obj_index, mverts, *mrest, live_curve_2d)
 
             self.remove_non_updated_objects(obj_index)
             objs = self.get_children()
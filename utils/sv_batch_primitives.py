@@ -7,17 +7,22 @@
 
 import bpy
 import gpu
+import numpy as np
 from gpu_extras.batch import batch_for_shader
 from mathutils import Matrix, Vector
 from sverchok.utils.logging import info, error
 
 if bpy.app.background:
     print("Will not initialize shaders in the background mode")
-    
+
     class MatrixDraw28(object):
         def draw_matrix(self, *args, **kwargs):
             info("draw_matrix: do nothing in background mode")
 
+    class MatrixDrawBatch28(object):
+        def draw_matrices(self, *args, **kwargs):
+            info("draw_matrices: do nothing in background mode")
+
 else:
 
     uniform_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
@@ -100,3 +105,58 @@ else:
             uniform_shader.uniform_float("color", bbcol)
             batch.draw(uniform_shader)
 
+
+    class MatrixDrawBatch28(object):
+        """
+        draws any number of matrix gizmos with two draw calls total (axes +
+        grids), instead of two batches per matrix like MatrixDraw28.
+        """
+
+        # the gizmo line lists in rest position; LINES consumes two
+        # consecutive verts per segment, matching MatrixDraw28's layout
+        axis_template = np.array([
+            [0.0, 0.0, 0.0], [ 0.5, 0.0, 0.0],
+            [0.0, 0.0, 0.0], [-0.5, 0.0, 0.0],
+            [0.0, 0.0, 0.0], [0.0,  0.5, 0.0],
+            [0.0, 0.0, 0.0], [0.0, -0.5, 0.0],
+            [0.0, 0.0, 0.0], [0.0, 0.0,  0.5],
+            [0.0, 0.0, 0.0], [0.0, 0.0, -0.5]], dtype=np.float32)
+
+        axis_colors = np.repeat(np.array([
+            (1.0, 0.2, 0.2, 1.0), (0.6, 0.0, 0.0, 1.0),
+            (0.2, 1.0, 0.2, 1.0), (0.0, 0.6, 0.0, 1.0),
+            (0.2, 0.2, 1.0, 1.0), (0.0, 0.0, 0.6, 1.0)], dtype=np.float32), 2, axis=0)
+
+        series1 = (-0.5, -0.3, -0.1, 0.1, 0.3, 0.5)
+        grid_template = np.array(
+            [(x, y, 0.0) for x in series1 for y in (-0.5, 0.5)] +
+            [(x, y, 0.0) for y in series1 for x in (-0.5, 0.5)], dtype=np.float32)
+
+        def draw_matrices(self, matrices, bbcol=(1.0, 1.0, 1.0, 1.0), skip=False, grid=True):
+            """matrices: iterable of mathutils.Matrix or 4x4 array-likes"""
+            if not len(matrices):
+                return
+
+            mats = np.array([np.array(m, dtype=np.float32) for m in matrices])
+            rots = mats[:, :3, :3]
+            locs = mats[:, :3, 3]
+
+            axis_tmpl, axis_cols = self.axis_template, self.axis_colors
+            if skip:
+                # drop the negative half-axes, as MatrixDraw28's skip does
+                axis_tmpl = axis_tmpl.reshape(6, 2, 3)[::2].reshape(-1, 3)
+                axis_cols = axis_cols.reshape(6, 2, 4)[::2].reshape(-1, 4)
+
+            coords = (np.einsum('mij,kj->mki', rots, axis_tmpl) + locs[:, np.newaxis, :]).reshape(-1, 3)
+            colors = np.tile(axis_cols, (mats.shape[0], 1))
+            batch = batch_for_shader(smooth_shader, "LINES", dict(pos=coords, color=colors))
+            batch.draw(smooth_shader)
+
+            if grid:
+                points = (np.einsum('mij,kj->mki', rots, self.grid_template)
+                              + locs[:, np.newaxis, :]).reshape(-1, 3)
+                batch = batch_for_shader(uniform_shader, "LINES", {"pos": points})
+                uniform_shader.bind()
+                uniform_shader.uniform_float("color", bbcol)
+                batch.draw(uniform_shader)
+
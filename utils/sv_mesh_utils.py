@@ -78,12 +78,15 @@ def polygons_to_edges(obj, unique_edges=False):
         out_edges = []
         seen = set()
         for face in faces:
-            for edge in zip(face, list(face[1:]) + list([face[0]])):
-                if unique_edges and tuple(sorted(edge)) in seen:
-                    continue
+            num_verts = len(face)
+            for k in range(num_verts):
+                a, b = face[k], face[(k + 1) % num_verts]
                 if unique_edges:
-                    seen.add(tuple(sorted(edge)))
-                out_edges.append(edge)
+                    key = (a, b) if a < b else (b, a)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                out_edges.append((a, b))
         out.append(out_edges)
     return out
 
@@ -377,10 +377,8 @@ class SvObjHelper():
             obj = self.create_object(object_name, obj_index, data)
         return obj
 
-    def get_obj_curve(self, obj_index):
+    def get_obj_curve(self, obj_index, clear_splines=True):
         curves = bpy.data.curves
-        objects = bpy.data.objects
-        collection = bpy.context.scene.collection
 
         curve_name = f'{self.basedata_name}.{obj_index:04d}'
 
@@ -390,8 +388,9 @@ class SvObjHelper():
             cu = curves.new(name=curve_name, type='CURVE')
         obj = self.get_or_create_object(curve_name, obj_index, cu)
 
-        # break down existing splines entirely.
-        if cu.splines:
+        # break down existing splines entirely - unless the caller wants to
+        # try reusing the existing layout (see viewer_curves).
+        if clear_splines and cu.splines:
             cu.splines.clear()
 
         return obj, cu